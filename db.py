@@ -1,416 +1,765 @@
 import os
+import atexit
 import sqlite3
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+import queue
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bir xil xato (xabar shabloni, xato turi) ko'pi bilan shuncha soniyada bir marta yoziladi:
+# masalan database qulflanganda har bir Telegram update log yozib sekinlashtirmaydi
+ERROR_LOG_INTERVAL = 1.0
+_LAST_ERROR_LOG: Dict[Tuple[str, type], float] = {}
+
+def _log_error(exc: Exception, msg: str, *args):
+    """Xatoni log qilish (bir xil xato sekundiga bir martadan ko'p yozilmaydi)"""
+    key = (msg, type(exc))
+    now = time.monotonic()
+    last = _LAST_ERROR_LOG.get(key)
+    if last is not None and now - last < ERROR_LOG_INTERVAL:
+        return
+    _LAST_ERROR_LOG[key] = now
+    logger.error(msg + ": %s", *args, exc)
 
 # SQLite3 database fayli
 DATABASE_NAME = 'garajhub.db'
 
+# Butun jarayon uchun bitta ulanish: har chaqiruvda ochib-yopish o'rniga qayta ishlatiladi
+_CONN: Optional[sqlite3.Connection] = None
+_CONN_LOCK = threading.Lock()
+# Yozish (commit) amallarini ketma-ket bajarish uchun
+_WRITE_LOCK = threading.Lock()
+
+# Ulanish ochilganda bir marta o'rnatiladigan sozlamalar
+_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA busy_timeout=5000',
+)
+# Faqat o'qish ulanishlari uchun (journal_mode faylda saqlanadi, synchronous o'qishga ta'sir qilmaydi)
+_READ_PRAGMAS = (
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA busy_timeout=5000',
+)
+
+# O'qish ulanishlari puli: WAL rejimida SELECT lar bir-birini va yozuvchini kutmaydi
+READ_POOL_SIZE = 4
+_READ_POOL: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=READ_POOL_SIZE)
+_READ_POOL_READY = False
+
 def get_db_connection():
-    """Database ulanishini olish"""
-    conn = sqlite3.connect(DATABASE_NAME, check_same_thread=False)
-    conn.row_factory = sqlite3.Row  # Row formatda natijalarni olish
+    """Database ulanishini olish (bir marta yaratiladi va yopilmaydi)"""
+    global _CONN
+    if _CONN is None:
+        with _CONN_LOCK:
+            if _CONN is None:
+                # isolation_level=None: yashirin BEGIN yo'q, tranzaksiyalar transaction() orqali
+                conn = sqlite3.connect(DATABASE_NAME, check_same_thread=False,
+                                       isolation_level=None, cached_statements=256)
+                conn.row_factory = sqlite3.Row  # Row formatda natijalarni olish
+                for pragma in _PRAGMAS:
+                    conn.execute(pragma)
+                _CONN = conn
+    return _CONN
+
+@contextmanager
+def transaction():
+    """Yozish tranzaksiyasi: BEGIN IMMEDIATE ... COMMIT, xatolikda ROLLBACK"""
+    conn = get_db_connection()
+    with _WRITE_LOCK:
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+def _open_read_connection() -> sqlite3.Connection:
+    """Faqat o'qish uchun (mode=ro) ulanish ochish"""
+    uri = Path(DATABASE_NAME).resolve().as_uri() + '?mode=ro'
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                           isolation_level=None, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    for pragma in _READ_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
+@contextmanager
+def read_conn():
+    """Puldan faqat o'qish uchun ulanish olish va ishdan keyin qaytarish.
+
+    Bir ulanish ushlab turilganda ichida yana read_conn() chaqirilmasin:
+    pul tugab qolsa oqim o'zini kutib qoladi.
+    """
+    global _READ_POOL_READY
+    if not _READ_POOL_READY:
+        get_db_connection()  # fayl va WAL rejimi avval yozuvchi ulanishda tayyorlanadi
+        with _CONN_LOCK:
+            if not _READ_POOL_READY:
+                # Avval hammasi ochiladi: yarmida xatolik bo'lsa pul chala to'lib qolmaydi
+                conns = []
+                try:
+                    for _ in range(READ_POOL_SIZE):
+                        conns.append(_open_read_connection())
+                except BaseException:
+                    for conn in conns:
+                        conn.close()
+                    raise
+                for conn in conns:
+                    _READ_POOL.put(conn)
+                _READ_POOL_READY = True
+    
+    conn = _READ_POOL.get()
+    try:
+        yield conn
+    finally:
+        _READ_POOL.put(conn)
+
+# =========== QATORLAR KESHI ===========
+# get_user/get_startup deyarli har bir Telegram update da chaqiriladi, qatorlar esa kam
+# o'zgaradi: oxirgi ishlatilganlar xotirada saqlanadi va yozishdan keyin tozalanadi
+
+ROW_CACHE_SIZE = 4096
+_USER_CACHE: "OrderedDict[int, Dict]" = OrderedDict()
+_STARTUP_CACHE: "OrderedDict[int, Dict]" = OrderedDict()
+_ROW_CACHE_LOCK = threading.Lock()
+# Har tozalashda oshadi: o'qish davomida yozuv bo'lsa eski qator keshga qo'yilmaydi
+_ROW_CACHE_VERSION = 0
+
+def _cache_get(cache: "OrderedDict[int, Dict]", key: int) -> Tuple[Optional[Dict], int]:
+    """Keshdan qator nusxasini va joriy versiyani olish"""
+    with _ROW_CACHE_LOCK:
+        row = cache.get(key)
+        if row is not None:
+            cache.move_to_end(key)
+            row = dict(row)
+        return row, _ROW_CACHE_VERSION
+
+def _cache_put(cache: "OrderedDict[int, Dict]", key: int, row: Dict, version: int):
+    """Qatorni keshga qo'yish (o'qishdan beri tozalash bo'lmagan bo'lsa)"""
+    with _ROW_CACHE_LOCK:
+        if version != _ROW_CACHE_VERSION:
+            return
+        cache[key] = row
+        cache.move_to_end(key)
+        if len(cache) > ROW_CACHE_SIZE:
+            cache.popitem(last=False)
+
+def _cache_invalidate(cache: "OrderedDict[int, Dict]", key: int):
+    """Qatorni keshdan olib tashlash (yozuv commit qilingandan keyin chaqiriladi)"""
+    global _ROW_CACHE_VERSION
+    with _ROW_CACHE_LOCK:
+        cache.pop(key, None)
+        _ROW_CACHE_VERSION += 1
+
+# =========== SQL SO'ROVLAR ===========
+# So'rov matnlari bir marta e'lon qilinadi: doimiy ulanishning statement keshidan
+# (cached_statements) qayta foydalaniladi va har chaqiruvda qayta kompilyatsiya qilinmaydi
+
+_SQL_GET_USER = 'SELECT * FROM users WHERE user_id = ?'
+# Mavjud foydalanuvchida faqat username/first_name yangilanadi: profil maydonlari
+# va joined_at (CURRENT_TIMESTAMP default) saqlanib qoladi
+_SQL_SAVE_USER = '''
+    INSERT INTO users (user_id, username, first_name)
+    VALUES (?, ?, ?)
+    ON CONFLICT(user_id) DO UPDATE SET
+        username = excluded.username,
+        first_name = excluded.first_name
+'''
+
+# Profilda tahrirlanadigan maydonlar: har biri uchun tayyor (o'zgarmas) so'rov
+_UPDATE_USER_SQL = {
+    field: f'UPDATE users SET {field} = ? WHERE user_id = ?'
+    for field in ('first_name', 'last_name', 'phone', 'gender', 'birth_date', 'bio')
+}
+
+_SQL_COUNT_BY_STATUS = 'SELECT status, COUNT(*) AS n FROM startups GROUP BY status'
+_SQL_CREATE_STARTUP = '''
+    INSERT INTO startups (name, description, logo, group_link, owner_id)
+    VALUES (?, ?, ?, ?, ?)
+'''
+_SQL_GET_STARTUP = 'SELECT * FROM startups WHERE id = ?'
+_SQL_STARTUPS_BY_OWNER = 'SELECT * FROM startups WHERE owner_id = ? ORDER BY created_at DESC, id DESC'
+_SQL_STARTUP_SUMMARIES_BY_OWNER = '''
+    SELECT id, name, status, created_at FROM startups
+    WHERE owner_id = ? ORDER BY created_at DESC, id DESC
+'''
+# OFFSET sahifasi: avval idx_startup_status_created dan faqat sahifadagi id lar olinadi,
+# keyin to'liq qatorlar (description, logo) faqat shu id lar uchun o'qiladi
+_SQL_STARTUPS_PAGE = '''
+    SELECT s.* FROM startups s
+    JOIN (SELECT id FROM startups WHERE status = ?
+          ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?) p ON s.id = p.id
+    ORDER BY s.created_at DESC, s.id DESC
+'''
+_SQL_STARTUPS_AFTER = '''
+    SELECT * FROM startups
+    WHERE status = ?
+      AND (created_at, id) < (SELECT created_at, id FROM startups WHERE id = ?)
+    ORDER BY created_at DESC, id DESC LIMIT ?
+'''
+_SQL_SET_STATUS_ACTIVE = 'UPDATE startups SET status = ?, started_at = CURRENT_TIMESTAMP WHERE id = ?'
+_SQL_SET_STATUS_COMPLETED = 'UPDATE startups SET status = ?, ended_at = CURRENT_TIMESTAMP WHERE id = ?'
+_SQL_SET_STATUS = 'UPDATE startups SET status = ? WHERE id = ?'
+_SQL_SET_RESULTS = 'UPDATE startups SET results = ? WHERE id = ?'
+
+_SQL_GET_MEMBER_ID = 'SELECT id FROM startup_members WHERE startup_id = ? AND user_id = ?'
+_SQL_GET_JOIN_REQUEST = '''
+    SELECT sm.user_id, s.name, s.group_link
+    FROM startup_members sm
+    JOIN startups s ON sm.startup_id = s.id
+    WHERE sm.id = ?
+'''
+# RETURNING SQLite 3.35 dan boshlab mavjud; eski versiyalarda INSERT OR IGNORE ishlatiladi
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Yangi so'rov qo'shiladi yoki mavjudi o'zgarishsiz qoladi; ikkala holatda ham id qaytadi
+_SQL_ADD_MEMBER = '''
+    INSERT INTO startup_members (startup_id, user_id)
+    VALUES (?, ?)
+    ON CONFLICT(startup_id, user_id) DO UPDATE SET startup_id = startup_id
+    RETURNING id
+'''
+_SQL_ADD_MEMBER_IGNORE = '''
+    INSERT OR IGNORE INTO startup_members (startup_id, user_id)
+    VALUES (?, ?)
+'''
+_SQL_SET_MEMBER_STATUS = 'UPDATE startup_members SET status = ? WHERE id = ?'
+_SQL_COUNT_MEMBERS = '''
+    SELECT COUNT(*) FROM startup_members sm
+    JOIN users u ON sm.user_id = u.user_id
+    WHERE sm.startup_id = ? AND sm.status = 'accepted'
+'''
+# A'zolar user_id tartibida: idx_member_startup_status (startup_id, status, user_id)
+# bo'yicha saralashsiz o'qiladi va kursor (user_id > ?) shu index ustida qidiriladi
+_SQL_MEMBERS_PAGE = '''
+    SELECT u.user_id, u.first_name, u.last_name, u.username, u.phone, u.bio
+    FROM startup_members sm
+    JOIN users u ON sm.user_id = u.user_id
+    WHERE sm.startup_id = ? AND sm.status = 'accepted'
+    ORDER BY sm.user_id LIMIT ? OFFSET ?
+'''
+_SQL_MEMBERS_AFTER = '''
+    SELECT u.user_id, u.first_name, u.last_name, u.username, u.phone, u.bio
+    FROM startup_members sm
+    JOIN users u ON sm.user_id = u.user_id
+    WHERE sm.startup_id = ? AND sm.status = 'accepted' AND sm.user_id > ?
+    ORDER BY sm.user_id LIMIT ?
+'''
+# user_id bo'yicha bo'laklab o'qish: idx_member_startup_status tartibida, saralashsiz
+_SQL_MEMBER_IDS_FIRST = '''
+    SELECT user_id FROM startup_members
+    WHERE startup_id = ? AND status = 'accepted'
+    ORDER BY user_id LIMIT ?
+'''
+_SQL_MEMBER_IDS_AFTER = '''
+    SELECT user_id FROM startup_members
+    WHERE startup_id = ? AND status = 'accepted' AND user_id > ?
+    ORDER BY user_id LIMIT ?
+'''
+
+_SQL_COUNT_USERS = 'SELECT COUNT(*) FROM users'
+_SQL_ALL_USER_IDS = 'SELECT user_id FROM users'
+_SQL_RECENT_USERS = '''
+    SELECT user_id, username, first_name, last_name, joined_at FROM users
+    ORDER BY joined_at DESC, id DESC LIMIT ?
+'''
+_SQL_RECENT_STARTUPS = '''
+    SELECT id, name, status, created_at FROM startups
+    ORDER BY created_at DESC, id DESC LIMIT ?
+'''
+
+# CURRENT_TIMESTAMP bilan to'ldiriladigan ustunlar
+_TIMESTAMP_COLUMNS = (
+    ('users', 'joined_at'),
+    ('startups', 'created_at'),
+    ('startups', 'started_at'),
+    ('startups', 'ended_at'),
+    ('startup_members', 'joined_at'),
+)
+
 def init_db():
     """Database jadvalarini yaratish"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Users jadvali
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER UNIQUE NOT NULL,
-            username TEXT,
-            first_name TEXT,
-            last_name TEXT DEFAULT '',
-            phone TEXT DEFAULT '',
-            gender TEXT DEFAULT '',
-            birth_date TEXT DEFAULT '',
-            bio TEXT DEFAULT '',
-            joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Startups jadvali
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS startups (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            description TEXT NOT NULL,
-            logo TEXT,
-            group_link TEXT NOT NULL,
-            owner_id INTEGER NOT NULL,
-            status TEXT DEFAULT 'pending',
-            results TEXT DEFAULT '',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            started_at TIMESTAMP,
-            ended_at TIMESTAMP,
-            FOREIGN KEY (owner_id) REFERENCES users(user_id)
-        )
-    ''')
-    
-    # Startup members jadvali
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS startup_members (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            startup_id INTEGER NOT NULL,
-            user_id INTEGER NOT NULL,
-            status TEXT DEFAULT 'pending',
-            joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(startup_id, user_id),
-            FOREIGN KEY (startup_id) REFERENCES startups(id),
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        )
-    ''')
-    
-    # Indexlar yaratish
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_user_id ON users(user_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_startup_owner ON startups(owner_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_startup_status ON startups(status)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_member_startup ON startup_members(startup_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_member_user ON startup_members(user_id)')
+    with transaction() as conn:
+        cursor = conn.cursor()
+        
+        # Users jadvali
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS users (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER UNIQUE NOT NULL,
+                username TEXT,
+                first_name TEXT,
+                last_name TEXT DEFAULT '',
+                phone TEXT DEFAULT '',
+                gender TEXT DEFAULT '',
+                birth_date TEXT DEFAULT '',
+                bio TEXT DEFAULT '',
+                joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Startups jadvali
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS startups (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                description TEXT NOT NULL,
+                logo TEXT,
+                group_link TEXT NOT NULL,
+                owner_id INTEGER NOT NULL,
+                status TEXT DEFAULT 'pending',
+                results TEXT DEFAULT '',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                started_at TIMESTAMP,
+                ended_at TIMESTAMP,
+                FOREIGN KEY (owner_id) REFERENCES users(user_id)
+            )
+        ''')
+        
+        # Startup members jadvali
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS startup_members (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                startup_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                status TEXT DEFAULT 'pending',
+                joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(startup_id, user_id),
+                FOREIGN KEY (startup_id) REFERENCES startups(id),
+                FOREIGN KEY (user_id) REFERENCES users(user_id)
+            )
+        ''')
+        
+        # Eski qatorlar datetime.now() bilan yozilgan (mahalliy vaqt, mikrosekundli):
+        # ularni CURRENT_TIMESTAMP formatiga (UTC, 'YYYY-MM-DD HH:MM:SS') keltirish
+        for table, column in _TIMESTAMP_COLUMNS:
+            cursor.execute(
+                f"UPDATE {table} SET {column} = datetime({column}, 'utc') "
+                f"WHERE length({column}) > 19"
+            )
+        
+        # Indexlar yaratish
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_user_id ON users(user_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_startup_owner ON startups(owner_id)')
+        # (status, created_at, id): holat bo'yicha sahifalar alohida saralashsiz o'qiladi;
+        # faqat status bo'yicha index uning prefiksi bo'lgani uchun keraksiz
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_startup_status_created ON startups(status, created_at DESC, id DESC)')
+        cursor.execute('DROP INDEX IF EXISTS idx_startup_status')
+        # (startup_id, status, user_id): a'zolar ro'yxati uchun qoplovchi index
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_member_startup_status ON startup_members(startup_id, status, user_id)')
+        cursor.execute('DROP INDEX IF EXISTS idx_member_startup')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_member_user ON startup_members(user_id)')
+        # a'zolar JOIN i users jadvaliga murojaat qilmasdan bajarilishi uchun
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_userid_covering ON users(user_id, first_name, last_name, username, phone, bio)')
+        
+        # Query planner uchun index statistikasi (kichik database uchun deyarli bepul)
+        cursor.execute('ANALYZE')
     
-    conn.commit()
-    conn.close()
-    logging.info("SQLite database initialized successfully")
+    logger.info("SQLite database initialized successfully")
+
+def _optimize_db():
+    """Jarayon tugashida statistikani yangilash (PRAGMA optimize)"""
+    if _CONN is None:
+        return
+    # Fondagi oqim yozish o'rtasida qolgan bo'lsa, chiqishni to'xtatib qo'ymaslik uchun
+    if not _WRITE_LOCK.acquire(timeout=5):
+        return
+    try:
+        _CONN.execute('PRAGMA optimize')
+    except Exception as e:
+        _log_error(e, "Error optimizing database")
+    finally:
+        _WRITE_LOCK.release()
+
+atexit.register(_optimize_db)
 
 # =========== USERS FUNCTIONS ===========
 
 def get_user(user_id: int) -> Optional[Dict]:
     """Foydalanuvchini ID bo'yicha olish"""
+    cached, version = _cache_get(_USER_CACHE, user_id)
+    if cached is not None:
+        return cached
+    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with read_conn() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute(
-            'SELECT * FROM users WHERE user_id = ?',
-            (user_id,)
-        )
+            cursor.execute(_SQL_GET_USER, (user_id,))
         
-        user = cursor.fetchone()
-        conn.close()
+            user = cursor.fetchone()
         
         if user:
+            user = dict(user)
+            _cache_put(_USER_CACHE, user_id, user, version)
             return dict(user)
         return None
     except Exception as e:
-        logging.error(f"Error getting user {user_id}: {e}")
+        _log_error(e, "Error getting user %s", user_id)
         return None
 
 def save_user(user_id: int, username: str, first_name: str):
     """Yangi foydalanuvchi qo'shish yoki mavjudni yangilash"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with transaction() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('''
-            INSERT OR REPLACE INTO users (user_id, username, first_name, joined_at)
-            VALUES (?, ?, ?, ?)
-        ''', (user_id, username, first_name, datetime.now()))
+            cursor.execute(_SQL_SAVE_USER, (user_id, username, first_name))
         
-        conn.commit()
-        conn.close()
+        _cache_invalidate(_USER_CACHE, user_id)
     except Exception as e:
-        logging.error(f"Error saving user {user_id}: {e}")
+        _log_error(e, "Error saving user %s", user_id)
 
 def update_user_field(user_id: int, field: str, value: str):
     """Foydalanuvchi maydonini yangilash"""
+    sql = _UPDATE_USER_SQL.get(field)
+    if sql is None:
+        raise ValueError(f"Unknown user field: {field}")
+    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with transaction() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute(
-            f'UPDATE users SET {field} = ? WHERE user_id = ?',
-            (value, user_id)
-        )
+            cursor.execute(sql, (value, user_id))
         
-        conn.commit()
-        conn.close()
+        _cache_invalidate(_USER_CACHE, user_id)
     except Exception as e:
-        logging.error(f"Error updating user field {user_id}.{field}: {e}")
+        _log_error(e, "Error updating user field %s.%s", user_id, field)
 
 # =========== STARTUPS FUNCTIONS ===========
 
+# Holat bo'yicha startuplar soni keshi: har sahifada COUNT(*) qayta hisoblanmaydi
+_COUNT_CACHE: Dict[str, int] = {}
+_COUNT_CACHE_FULL = False  # True bo'lsa keshda barcha holatlar bor
+_COUNT_LOCK = threading.Lock()
+
+def _status_counts() -> Dict[str, int]:
+    """Barcha holatlar bo'yicha startuplar soni (bitta GROUP BY so'rovi, keshdan)"""
+    global _COUNT_CACHE_FULL
+    with _COUNT_LOCK:
+        if not _COUNT_CACHE_FULL:
+            with read_conn() as conn:
+                rows = conn.execute(_SQL_COUNT_BY_STATUS).fetchall()
+            _COUNT_CACHE.clear()
+            _COUNT_CACHE.update((row['status'], row['n']) for row in rows)
+            _COUNT_CACHE_FULL = True
+        return dict(_COUNT_CACHE)
+
+def _get_count(status: str) -> int:
+    """Holat bo'yicha startuplar sonini keshdan olish"""
+    return _status_counts().get(status, 0)
+
+def _invalidate_counts():
+    """Startuplar soni keshini tozalash (startup qo'shilganda yoki holati o'zgarganda)"""
+    global _COUNT_CACHE_FULL
+    with _COUNT_LOCK:
+        _COUNT_CACHE.clear()
+        _COUNT_CACHE_FULL = False
+
 def create_startup(name: str, description: str, logo: str, group_link: str, owner_id: int) -> Optional[int]:
     """Yangi startup yaratish"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with transaction() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('''
-            INSERT INTO startups (name, description, logo, group_link, owner_id, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (name, description, logo, group_link, owner_id, datetime.now()))
+            cursor.execute(_SQL_CREATE_STARTUP, (name, description, logo, group_link, owner_id))
         
-        startup_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+            startup_id = cursor.lastrowid
         
+        _invalidate_counts()
         return startup_id
     except Exception as e:
-        logging.error(f"Error creating startup: {e}")
+        _log_error(e, "Error creating startup")
         return None
 
 def get_startup(startup_id: int) -> Optional[Dict]:
     """Startupni ID bo'yicha olish"""
+    cached, version = _cache_get(_STARTUP_CACHE, startup_id)
+    if cached is not None:
+        return cached
+    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with read_conn() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute(
-            'SELECT * FROM startups WHERE id = ?',
-            (startup_id,)
-        )
+            cursor.execute(_SQL_GET_STARTUP, (startup_id,))
         
-        startup = cursor.fetchone()
-        conn.close()
+            startup = cursor.fetchone()
         
         if startup:
+            startup = dict(startup)
+            _cache_put(_STARTUP_CACHE, startup_id, startup, version)
             return dict(startup)
         return None
     except Exception as e:
-        logging.error(f"Error getting startup {startup_id}: {e}")
+        _log_error(e, "Error getting startup %s", startup_id)
         return None
 
 def get_startups_by_owner(owner_id: int) -> List[Dict]:
     """Muallif ID bo'yicha startuplarni olish"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with read_conn() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute(
-            'SELECT * FROM startups WHERE owner_id = ? ORDER BY created_at DESC',
-            (owner_id,)
-        )
+            cursor.execute(_SQL_STARTUPS_BY_OWNER, (owner_id,))
         
-        startups = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+            startups = [dict(row) for row in cursor.fetchall()]
         
-        return startups
+            return startups
     except Exception as e:
-        logging.error(f"Error getting startups for owner {owner_id}: {e}")
+        _log_error(e, "Error getting startups for owner %s", owner_id)
         return []
 
-def get_pending_startups(page: int = 1, per_page: int = 5) -> Tuple[List[Dict], int]:
-    """Kutilayotgan startuplar"""
+def get_startup_summaries_by_owner(owner_id: int) -> List[sqlite3.Row]:
+    """Muallif startuplarining qisqa ro'yxati (id, name, status, created_at).
+
+    Ro'yxat ko'rinishlari uchun: description/logo o'qilmaydi va qatorlar dict ga
+    aylantirilmaydi - sqlite3.Row ham row['name'] ko'rinishida ishlaydi.
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with read_conn() as conn:
+            cursor = conn.cursor()
         
-        # Jami son
-        cursor.execute('SELECT COUNT(*) FROM startups WHERE status = "pending"')
-        total = cursor.fetchone()[0]
+            cursor.execute(_SQL_STARTUP_SUMMARIES_BY_OWNER, (owner_id,))
         
-        # Sahifalangan natijalar
-        offset = (page - 1) * per_page
-        cursor.execute(
-            'SELECT * FROM startups WHERE status = "pending" ORDER BY created_at DESC LIMIT ? OFFSET ?',
-            (per_page, offset)
-        )
-        
-        startups = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        
-        return startups, total
+            return cursor.fetchall()
     except Exception as e:
-        logging.error(f"Error getting pending startups: {e}")
-        return [], 0
+        _log_error(e, "Error getting startup summaries for owner %s", owner_id)
+        return []
 
-def get_active_startups(page: int = 1, per_page: int = 10) -> Tuple[List[Dict], int]:
-    """Faol startuplar"""
+def get_startups_by_status(status: str, page: int = 1, per_page: int = 5,
+                           after_id: Optional[int] = None) -> Tuple[List[Dict], int]:
+    """Holat bo'yicha startuplar sahifasi va shu holatdagi jami son.
+
+    Holat so'rovga parametr sifatida beriladi: barcha holatlar bitta tayyor so'rov
+    va bitta so'rov rejasidan foydalanadi.
+
+    after_id berilsa (oldingi sahifaning oxirgi startup ID si), OFFSET o'rniga
+    (created_at, id) kursori bo'yicha keyingi sahifa olinadi.
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        # Jami son keshdan; bo'lmasa bitta GROUP BY (qoplovchi index, saralashsiz) bilan
+        # to'ldiriladi. read_conn() dan tashqarida: ichma-ich ulanish olinmasligi uchun
+        total = _get_count(status)
         
-        # Jami son
-        cursor.execute('SELECT COUNT(*) FROM startups WHERE status = "active"')
-        total = cursor.fetchone()[0]
+        with read_conn() as conn:
+            cursor = conn.cursor()
         
-        # Sahifalangan natijalar
-        offset = (page - 1) * per_page
-        cursor.execute(
-            'SELECT * FROM startups WHERE status = "active" ORDER BY created_at DESC LIMIT ? OFFSET ?',
-            (per_page, offset)
-        )
+            # Sahifalangan natijalar
+            if after_id is not None:
+                cursor.execute(_SQL_STARTUPS_AFTER, (status, after_id, per_page))
+            else:
+                offset = (page - 1) * per_page
+                cursor.execute(_SQL_STARTUPS_PAGE, (status, per_page, offset))
         
-        startups = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+            startups = [dict(row) for row in cursor.fetchall()]
         
         return startups, total
     except Exception as e:
-        logging.error(f"Error getting active startups: {e}")
+        _log_error(e, "Error getting %s startups", status)
         return [], 0
 
+def get_pending_startups(page: int = 1, per_page: int = 5,
+                        after_id: Optional[int] = None) -> Tuple[List[Dict], int]:
+    """Kutilayotgan startuplar"""
+    return get_startups_by_status('pending', page, per_page, after_id)
+
+def get_active_startups(page: int = 1, per_page: int = 10,
+                       after_id: Optional[int] = None) -> Tuple[List[Dict], int]:
+    """Faol startuplar"""
+    return get_startups_by_status('active', page, per_page, after_id)
+
 def update_startup_status(startup_id: int, status: str):
     """Startup holatini yangilash"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        if status == 'active':
-            cursor.execute(
-                'UPDATE startups SET status = ?, started_at = ? WHERE id = ?',
-                (status, datetime.now(), startup_id)
-            )
-        elif status == 'completed':
-            cursor.execute(
-                'UPDATE startups SET status = ?, ended_at = ? WHERE id = ?',
-                (status, datetime.now(), startup_id)
-            )
-        else:
-            cursor.execute(
-                'UPDATE startups SET status = ? WHERE id = ?',
-                (status, startup_id)
-            )
-        
-        conn.commit()
-        conn.close()
+        with transaction() as conn:
+            cursor = conn.cursor()
+        
+            if status == 'active':
+                cursor.execute(_SQL_SET_STATUS_ACTIVE, (status, startup_id))
+            elif status == 'completed':
+                cursor.execute(_SQL_SET_STATUS_COMPLETED, (status, startup_id))
+            else:
+                cursor.execute(_SQL_SET_STATUS, (status, startup_id))
+        
+        _invalidate_counts()
+        _cache_invalidate(_STARTUP_CACHE, startup_id)
     except Exception as e:
-        logging.error(f"Error updating startup status {startup_id}: {e}")
+        _log_error(e, "Error updating startup status %s", startup_id)
 
 def update_startup_results(startup_id: int, results: str):
     """Startup natijalarini yangilash"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with transaction() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute(
-            'UPDATE startups SET results = ? WHERE id = ?',
-            (results, startup_id)
-        )
+            cursor.execute(_SQL_SET_RESULTS, (results, startup_id))
         
-        conn.commit()
-        conn.close()
+        _cache_invalidate(_STARTUP_CACHE, startup_id)
     except Exception as e:
-        logging.error(f"Error updating startup results {startup_id}: {e}")
+        _log_error(e, "Error updating startup results %s", startup_id)
 
 # =========== STARTUP MEMBERS FUNCTIONS ===========
 
 def add_startup_member(startup_id: int, user_id: int) -> Optional[int]:
-    """Startupga a'zo qo'shish"""
+    """Startupga a'zo qo'shish (mavjud bo'lsa uning ID si qaytariladi)"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Mavjudligini tekshirish
-        cursor.execute(
-            'SELECT id FROM startup_members WHERE startup_id = ? AND user_id = ?',
-            (startup_id, user_id)
-        )
-        
-        existing = cursor.fetchone()
-        if existing:
-            conn.close()
-            return existing['id']
-        
-        # Yangi a'zo qo'shish
-        cursor.execute('''
-            INSERT INTO startup_members (startup_id, user_id, joined_at)
-            VALUES (?, ?, ?)
-        ''', (startup_id, user_id, datetime.now()))
-        
-        request_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with transaction() as conn:
+            cursor = conn.cursor()
+        
+            if _HAS_RETURNING:
+                cursor.execute(_SQL_ADD_MEMBER, (startup_id, user_id))
+                request_id = cursor.fetchone()['id']
+            else:
+                # Yangi a'zo (odatiy holat) bitta so'rov; faqat mavjud bo'lsa ID qidiriladi
+                cursor.execute(_SQL_ADD_MEMBER_IGNORE, (startup_id, user_id))
+                if cursor.rowcount:
+                    request_id = cursor.lastrowid
+                else:
+                    cursor.execute(_SQL_GET_MEMBER_ID, (startup_id, user_id))
+                    request_id = cursor.fetchone()['id']
         
         return request_id
     except Exception as e:
-        logging.error(f"Error adding startup member: {e}")
+        _log_error(e, "Error adding startup member")
         return None
 
+def add_startup_members_bulk(startup_id: int, user_ids: List[int]) -> int:
+    """Startupga bir nechta a'zoni bitta tranzaksiyada qo'shish (mavjudlari o'tkazib yuboriladi)"""
+    try:
+        with transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.executemany(
+                _SQL_ADD_MEMBER_IGNORE,
+                [(startup_id, user_id) for user_id in user_ids]
+            )
+            
+            added = cursor.rowcount
+        
+        return added
+    except Exception as e:
+        _log_error(e, "Error adding startup members to %s", startup_id)
+        return 0
+
 def get_join_request_id(startup_id: int, user_id: int) -> Optional[int]:
     """Qo'shilish so'rovi ID sini olish"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with read_conn() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute(
-            'SELECT id FROM startup_members WHERE startup_id = ? AND user_id = ?',
-            (startup_id, user_id)
-        )
+            cursor.execute(_SQL_GET_MEMBER_ID, (startup_id, user_id))
         
-        request = cursor.fetchone()
-        conn.close()
+            request = cursor.fetchone()
         
-        if request:
-            return request['id']
+            if request:
+                return request['id']
+            return None
+    except Exception as e:
+        _log_error(e, "Error getting join request")
         return None
+
+def get_join_request(request_id: int) -> Optional[Dict]:
+    """Qo'shilish so'rovi egasi va startup ma'lumotlarini olish (user_id, name, group_link)"""
+    try:
+        with read_conn() as conn:
+            cursor = conn.cursor()
+        
+            cursor.execute(_SQL_GET_JOIN_REQUEST, (request_id,))
+        
+            request = cursor.fetchone()
+        
+            if request:
+                return dict(request)
+            return None
     except Exception as e:
-        logging.error(f"Error getting join request: {e}")
+        _log_error(e, "Error getting join request %s", request_id)
         return None
 
 def update_join_request(request_id: int, status: str):
     """Qo'shilish so'rovini yangilash"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with transaction() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute(
-            'UPDATE startup_members SET status = ? WHERE id = ?',
-            (status, request_id)
-        )
-        
-        conn.commit()
-        conn.close()
+            cursor.execute(_SQL_SET_MEMBER_STATUS, (status, request_id))
     except Exception as e:
-        logging.error(f"Error updating join request {request_id}: {e}")
+        _log_error(e, "Error updating join request %s", request_id)
 
-def get_startup_members(startup_id: int, page: int = 1, per_page: int = 5) -> Tuple[List[Dict], int]:
-    """Startup a'zolarini olish"""
+def get_startup_members(startup_id: int, page: int = 1, per_page: int = 5,
+                        after_id: Optional[int] = None) -> Tuple[List[Dict], int]:
+    """Startup a'zolarini olish (after_id - oldingi sahifaning oxirgi user_id si)"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with read_conn() as conn:
+            cursor = conn.cursor()
+        
+            # Jami son
+            cursor.execute(_SQL_COUNT_MEMBERS, (startup_id,))
+            total = cursor.fetchone()[0]
+        
+            # Sahifalangan natijalar
+            if after_id is not None:
+                cursor.execute(_SQL_MEMBERS_AFTER, (startup_id, after_id, per_page))
+            else:
+                offset = (page - 1) * per_page
+                cursor.execute(_SQL_MEMBERS_PAGE, (startup_id, per_page, offset))
         
-        # Jami son
-        cursor.execute(
-            '''SELECT COUNT(*) FROM startup_members sm
-               JOIN users u ON sm.user_id = u.user_id
-               WHERE sm.startup_id = ? AND sm.status = "accepted"''',
-            (startup_id,)
-        )
-        total = cursor.fetchone()[0]
-        
-        # Sahifalangan natijalar
-        offset = (page - 1) * per_page
-        cursor.execute(
-            '''SELECT u.user_id, u.first_name, u.last_name, u.username, u.phone, u.bio
-               FROM startup_members sm
-               JOIN users u ON sm.user_id = u.user_id
-               WHERE sm.startup_id = ? AND sm.status = "accepted"
-               LIMIT ? OFFSET ?''',
-            (startup_id, per_page, offset)
-        )
-        
-        members = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        
-        return members, total
+            members = [dict(row) for row in cursor.fetchall()]
+        
+            return members, total
     except Exception as e:
-        logging.error(f"Error getting startup members {startup_id}: {e}")
+        _log_error(e, "Error getting startup members %s", startup_id)
         return [], 0
 
+# iter_startup_members bir martada o'qiydigan user_id lar soni
+MEMBER_BATCH_SIZE = 256
+
+def iter_startup_members(startup_id: int) -> Iterator[int]:
+    """Startupning barcha a'zolari (user_id lar) - generator.
+
+    A'zolar MEMBER_BATCH_SIZE talik bo'laklarda o'qiladi va ulanish har bo'lakdan
+    keyin pulga qaytariladi: xabar yuborish davomida ulanish band qilinmaydi,
+    xotira esa a'zolar soniga bog'liq emas.
+
+    Bo'lakni o'qishda xatolik yuz bersa, istisno chaqiruvchiga uzatiladi:
+    qisman ro'yxat jimgina to'liq deb qabul qilinmasligi kerak.
+    """
+    last_id = None
+    while True:
+        with read_conn() as conn:
+            if last_id is None:
+                cursor = conn.execute(_SQL_MEMBER_IDS_FIRST, (startup_id, MEMBER_BATCH_SIZE))
+            else:
+                cursor = conn.execute(_SQL_MEMBER_IDS_AFTER, (startup_id, last_id, MEMBER_BATCH_SIZE))
+            rows = cursor.fetchall()
+        
+        for row in rows:
+            yield row['user_id']
+        
+        if len(rows) < MEMBER_BATCH_SIZE:
+            return
+        last_id = rows[-1]['user_id']
+
 def get_all_startup_members(startup_id: int) -> List[int]:
     """Startupning barcha a'zolari (faqat user_id lar)"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            'SELECT user_id FROM startup_members WHERE startup_id = ? AND status = "accepted"',
-            (startup_id,)
-        )
-        
-        members = [row['user_id'] for row in cursor.fetchall()]
-        conn.close()
-        
-        return members
+        return list(iter_startup_members(startup_id))
     except Exception as e:
-        logging.error(f"Error getting all startup members {startup_id}: {e}")
+        _log_error(e, "Error getting all startup members %s", startup_id)
         return []
 
 # =========== STATISTICS FUNCTIONS ===========
@@ -418,140 +767,73 @@ def get_all_startup_members(startup_id: int) -> List[int]:
 def get_statistics() -> Dict:
     """Umumiy statistika"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with read_conn() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('SELECT COUNT(*) FROM users')
-        total_users = cursor.fetchone()[0]
+            cursor.execute(_SQL_COUNT_USERS)
+            total_users = cursor.fetchone()[0]
         
-        cursor.execute('SELECT COUNT(*) FROM startups')
-        total_startups = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM startups WHERE status = "active"')
-        active_startups = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM startups WHERE status = "pending"')
-        pending_startups = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM startups WHERE status = "completed"')
-        completed_startups = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM startups WHERE status = "rejected"')
-        rejected_startups = cursor.fetchone()[0]
-        
-        conn.close()
+        # Startuplar soni holat bo'yicha bitta GROUP BY so'rovidan (keshlanadi)
+        counts = _status_counts()
         
         return {
             'total_users': total_users,
-            'total_startups': total_startups,
-            'active_startups': active_startups,
-            'pending_startups': pending_startups,
-            'completed_startups': completed_startups,
-            'rejected_startups': rejected_startups
+            'total_startups': sum(counts.values()),
+            'active_startups': counts.get('active', 0),
+            'pending_startups': counts.get('pending', 0),
+            'completed_startups': counts.get('completed', 0),
+            'rejected_startups': counts.get('rejected', 0)
         }
     except Exception as e:
-        logging.error(f"Error getting statistics: {e}")
+        _log_error(e, "Error getting statistics")
         return {}
 
 def get_all_users() -> List[int]:
     """Barcha foydalanuvchi ID larini olish"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with read_conn() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('SELECT user_id FROM users')
-        users = [row['user_id'] for row in cursor.fetchall()]
-        conn.close()
+            cursor.execute(_SQL_ALL_USER_IDS)
+            users = [row['user_id'] for row in cursor.fetchall()]
         
-        return users
+            return users
     except Exception as e:
-        logging.error(f"Error getting all users: {e}")
+        _log_error(e, "Error getting all users")
         return []
 
-def get_recent_users(limit: int = 10) -> List[Dict]:
-    """So'nggi foydalanuvchilar"""
+def get_recent_users(limit: int = 10) -> List[sqlite3.Row]:
+    """So'nggi foydalanuvchilar (sqlite3.Row: row['first_name'] ko'rinishida o'qiladi)"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with read_conn() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute(
-            'SELECT user_id, username, first_name, last_name, joined_at FROM users ORDER BY joined_at DESC LIMIT ?',
-            (limit,)
-        )
+            cursor.execute(_SQL_RECENT_USERS, (limit,))
         
-        users = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        
-        return users
+            return cursor.fetchall()
     except Exception as e:
-        logging.error(f"Error getting recent users: {e}")
+        _log_error(e, "Error getting recent users")
         return []
 
-def get_recent_startups(limit: int = 10) -> List[Dict]:
-    """So'nggi startuplar"""
+def get_recent_startups(limit: int = 10) -> List[sqlite3.Row]:
+    """So'nggi startuplar (sqlite3.Row: row['name'] ko'rinishida o'qiladi)"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with read_conn() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute(
-            'SELECT id, name, status, created_at FROM startups ORDER BY created_at DESC LIMIT ?',
-            (limit,)
-        )
+            cursor.execute(_SQL_RECENT_STARTUPS, (limit,))
         
-        startups = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        
-        return startups
+            return cursor.fetchall()
     except Exception as e:
-        logging.error(f"Error getting recent startups: {e}")
+        _log_error(e, "Error getting recent startups")
         return []
 
-def get_completed_startups(page: int = 1, per_page: int = 5) -> Tuple[List[Dict], int]:
+def get_completed_startups(page: int = 1, per_page: int = 5,
+                          after_id: Optional[int] = None) -> Tuple[List[Dict], int]:
     """Yakunlangan startuplar"""
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Jami son
-        cursor.execute('SELECT COUNT(*) FROM startups WHERE status = "completed"')
-        total = cursor.fetchone()[0]
-        
-        # Sahifalangan natijalar
-        offset = (page - 1) * per_page
-        cursor.execute(
-            'SELECT * FROM startups WHERE status = "completed" ORDER BY created_at DESC LIMIT ? OFFSET ?',
-            (per_page, offset)
-        )
-        
-        startups = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        
-        return startups, total
-    except Exception as e:
-        logging.error(f"Error getting completed startups: {e}")
-        return [], 0
+    return get_startups_by_status('completed', page, per_page, after_id)
 
-def get_rejected_startups(page: int = 1, per_page: int = 5) -> Tuple[List[Dict], int]:
+def get_rejected_startups(page: int = 1, per_page: int = 5,
+                         after_id: Optional[int] = None) -> Tuple[List[Dict], int]:
     """Rad etilgan startuplar"""
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Jami son
-        cursor.execute('SELECT COUNT(*) FROM startups WHERE status = "rejected"')
-        total = cursor.fetchone()[0]
-        
-        # Sahifalangan natijalar
-        offset = (page - 1) * per_page
-        cursor.execute(
-            'SELECT * FROM startups WHERE status = "rejected" ORDER BY created_at DESC LIMIT ? OFFSET ?',
-            (per_page, offset)
-        )
-        
-        startups = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        
-        return startups, total
-    except Exception as e:
-        logging.error(f"Error getting rejected startups: {e}")
-        return [], 0
\ No newline at end of file
+    return get_startups_by_status('rejected', page, per_page, after_id)
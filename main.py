@@ -1,4 +1,6 @@
 import os
+import sys
+import signal
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
@@ -28,12 +30,12 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(level
 from db import (
     init_db,
     get_user, save_user, update_user_field,
-    create_startup, get_startup, get_startups_by_owner,
+    create_startup, get_startup, get_startup_summaries_by_owner,
     get_pending_startups, get_active_startups, update_startup_status, update_startup_results,
-    add_startup_member, get_join_request_id, update_join_request,
+    add_startup_member, get_join_request_id, get_join_request, update_join_request,
     get_startup_members, get_statistics, get_all_users,
     get_recent_users, get_recent_startups, get_completed_startups,
-    get_rejected_startups, get_all_startup_members
+    get_rejected_startups, iter_startup_members
 )
 
 # Database initialization
@@ -330,9 +332,9 @@ def show_startups(message):
     bot.send_message(message.chat.id, "🌐 <b>Startaplar ro'yxati:</b>")
     show_startup_page(message.chat.id, 1)
 
-def show_startup_page(chat_id, page):
+def show_startup_page(chat_id, page, after_id=None):
     per_page = 1
-    startups, total = get_active_startups(page, per_page=per_page)
+    startups, total = get_active_startups(page, per_page=per_page, after_id=after_id)
     
     if not startups:
         bot.send_message(chat_id, "📭 <b>Hozircha startup mavjud emas.</b>", reply_markup=create_back_button())
@@ -361,7 +363,7 @@ def show_startup_page(chat_id, page):
     if page > 1:
         nav_buttons.append(InlineKeyboardButton('⏮️ Oldingi', callback_data=f'startup_page_{page-1}'))
     if page < total_pages:
-        nav_buttons.append(InlineKeyboardButton('⏭️ Keyingi', callback_data=f'startup_page_{page+1}'))
+        nav_buttons.append(InlineKeyboardButton('⏭️ Keyingi', callback_data=f'startup_page_{page+1}_{startup["id"]}'))
     
     if nav_buttons:
         markup.row(*nav_buttons)
@@ -380,9 +382,11 @@ def show_startup_page(chat_id, page):
 @bot.callback_query_handler(func=lambda call: call.data.startswith('startup_page_'))
 def handle_startup_page(call):
     try:
-        page = int(call.data.split('_')[2])
+        parts = call.data.split('_')
+        page = int(parts[2])
+        after_id = int(parts[3]) if len(parts) > 3 else None
         bot.delete_message(call.message.chat.id, call.message.message_id)
-        show_startup_page(call.message.chat.id, page)
+        show_startup_page(call.message.chat.id, page, after_id)
         bot.answer_callback_query(call.id)
     except:
         bot.answer_callback_query(call.id, "⚠️ Xatolik yuz berdi!", show_alert=True)
@@ -399,8 +403,7 @@ def handle_join_startup(call):
         if request_id:
             bot.answer_callback_query(call.id, "📩 Sizning so'rovingiz hali ko'rib chiqilmoqda!", show_alert=True)
         else:
-            add_startup_member(startup_id, user_id)
-            request_id = get_join_request_id(startup_id, user_id)
+            request_id = add_startup_member(startup_id, user_id)
             
             bot.answer_callback_query(call.id, "✅ So'rov yuborildi. Startup egasi tasdiqlasa, sizga xabar yuboriladi.", show_alert=True)
             
@@ -436,19 +439,7 @@ def approve_join_request(call):
         request_id = int(call.data.split('_')[2])
         update_join_request(request_id, 'accepted')
         
-        from db import get_db_connection
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT sm.user_id, s.name, s.group_link 
-            FROM startup_members sm
-            JOIN startups s ON sm.startup_id = s.id
-            WHERE sm.id = ?
-        ''', (request_id,))
-        
-        result = cursor.fetchone()
-        conn.close()
+        result = get_join_request(request_id)
         
         if result:
             user_id = result['user_id']
@@ -482,13 +473,7 @@ def reject_join_request(call):
     try:
         request_id = int(call.data.split('_')[2])
         
-        from db import get_db_connection
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT user_id FROM startup_members WHERE id = ?', (request_id,))
-        result = cursor.fetchone()
-        conn.close()
+        result = get_join_request(request_id)
         
         if result:
             user_id = result['user_id']
@@ -520,7 +505,7 @@ def show_my_startups(message):
     show_my_startups_page(message.chat.id, user_id, 1)
 
 def show_my_startups_page(chat_id, user_id, page):
-    startups = get_startups_by_owner(user_id)
+    startups = get_startup_summaries_by_owner(user_id)
     
     if not startups:
         bot.send_message(chat_id, "📭 <b>Sizda hali startup mavjud emas.</b>", reply_markup=create_back_button())
@@ -662,8 +647,9 @@ def view_startup_members(call):
         parts = call.data.split('_')
         startup_id = int(parts[2])
         page = int(parts[3])
+        after_id = int(parts[4]) if len(parts) > 4 else None
         
-        members, total = get_startup_members(startup_id, page)
+        members, total = get_startup_members(startup_id, page, after_id=after_id)
         total_pages = max(1, (total + 4) // 5)
         
         try:
@@ -692,8 +678,8 @@ def view_startup_members(call):
         nav_buttons = []
         if page > 1:
             nav_buttons.append(InlineKeyboardButton('⏮️ Oldingi', callback_data=f'view_members_{startup_id}_{page-1}'))
-        if page < total_pages:
-            nav_buttons.append(InlineKeyboardButton('⏭️ Keyingi', callback_data=f'view_members_{startup_id}_{page+1}'))
+        if page < total_pages and members:
+            nav_buttons.append(InlineKeyboardButton('⏭️ Keyingi', callback_data=f'view_members_{startup_id}_{page+1}_{members[-1]["user_id"]}'))
         
         if nav_buttons:
             markup.row(*nav_buttons)
@@ -793,30 +779,39 @@ def process_startup_photo(message, startup_id, results_text):
         update_startup_status(startup_id, 'completed')
         update_startup_results(startup_id, results_text)
         
-        members = get_all_startup_members(startup_id)
         startup = get_startup(startup_id)
         
         end_date = datetime.now().strftime('%d-%m-%Y')
         success_count = 0
         
-        for member_id in members:
-            try:
-                bot.send_photo(
-                    member_id,
-                    photo_id,
-                    caption=(
-                        f"🏁 <b>Startup yakunlandi</b>\n\n"
-                        f"🎯 <b>{startup['name']}</b>\n"
-                        f"📅 <b>Yakunlangan sana:</b> {end_date}\n"
-                        f"📝 <b>Natijalar:</b> {results_text}"
+        delivery_complete = True
+        try:
+            for member_id in iter_startup_members(startup_id):
+                try:
+                    bot.send_photo(
+                        member_id,
+                        photo_id,
+                        caption=(
+                            f"🏁 <b>Startup yakunlandi</b>\n\n"
+                            f"🎯 <b>{startup['name']}</b>\n"
+                            f"📅 <b>Yakunlangan sana:</b> {end_date}\n"
+                            f"📝 <b>Natijalar:</b> {results_text}"
+                        )
                     )
-                )
-                success_count += 1
-            except:
-                pass
+                    success_count += 1
+                except:
+                    pass
+        except Exception as e:
+            delivery_complete = False
+            logging.error(f"A'zolarni o'qishda xatolik ({success_count} ta a'zoga yuborilgan): {e}")
+        
+        if delivery_complete:
+            result_text = f"✅ <b>Startup muvaffaqiyatli yakunlandi!</b>\n\n"
+        else:
+            result_text = f"⚠️ <b>Startup yakunlandi, lekin xabar barcha a'zolarga yuborilmadi!</b>\n\n"
         
         bot.send_message(message.chat.id, 
-                        f"✅ <b>Startup muvaffaqiyatli yakunlandi!</b>\n\n"
+                        result_text +
                         f"📤 Xabar yuborildi: {success_count} ta a'zoga", 
                         reply_markup=create_back_button())
         
@@ -1015,7 +1010,7 @@ def admin_dashboard(message):
     if recent_users:
         dashboard_text += f"👥 <b>So'nggi foydalanuvchilar:</b>\n"
         for i, user in enumerate(recent_users, 1):
-            dashboard_text += f"{i}. {user.get('first_name', '')} {user.get('last_name', '')}\n"
+            dashboard_text += f"{i}. {user['first_name']} {user['last_name']}\n"
         dashboard_text += "\n"
     
     if recent_startups:
@@ -1067,8 +1062,10 @@ def show_pending_startups(call):
         bot.answer_callback_query(call.id, "❌ Ruxsat yo'q!", show_alert=True)
         return
     
-    page = int(call.data.split('_')[2])
-    startups, total = get_pending_startups(page)
+    parts = call.data.split('_')
+    page = int(parts[2])
+    after_id = int(parts[3]) if len(parts) > 3 else None
+    startups, total = get_pending_startups(page, after_id=after_id)
     
     if not startups:
         text = "⏳ <b>Kutilayotgan startaplar yo'q.</b>"
@@ -1092,7 +1089,7 @@ def show_pending_startups(call):
         nav_buttons.append(InlineKeyboardButton(f'{page}/{total_pages}', callback_data='current_page'))
         
         if page < total_pages:
-            nav_buttons.append(InlineKeyboardButton('⏭️', callback_data=f'pending_startups_{page+1}'))
+            nav_buttons.append(InlineKeyboardButton('⏭️', callback_data=f'pending_startups_{page+1}_{startups[-1]["id"]}'))
         
         if nav_buttons:
             markup.row(*nav_buttons)
@@ -1272,7 +1269,7 @@ def admin_users(message):
     )
     
     for i, user in enumerate(recent_users, 1):
-        joined_date = user.get('joined_at', '—')
+        joined_date = user['joined_at']
         if joined_date and joined_date != '—':
             try:
                 if isinstance(joined_date, str):
@@ -1280,12 +1277,12 @@ def admin_users(message):
             except:
                 pass
         
-        name = f"{user.get('first_name', '')} {user.get('last_name', '')}".strip()
+        name = f"{user['first_name']} {user['last_name']}".strip()
         if not name:
             name = "Noma'lum"
         
         text += f"{i}. <b>{name}</b>\n"
-        text += f"   👤 @{user.get('username', '—')} | 📅 {joined_date}\n\n"
+        text += f"   👤 @{user['username']} | 📅 {joined_date}\n\n"
     
     markup = InlineKeyboardMarkup()
     markup.add(
@@ -1502,6 +1499,10 @@ if __name__ == '__main__':
     polling_thread = threading.Thread(target=start_polling, daemon=True)
     polling_thread.start()
     
+    # Render jarayonni SIGTERM bilan to'xtatadi: sys.exit orqali chiqilsa atexit
+    # hooklari (db dagi PRAGMA optimize) ishlaydi
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
     # Flask serverni ishga tushirish
     port = int(os.environ.get('PORT', 10000))
     app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file